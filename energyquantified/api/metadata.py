@@ -71,15 +71,18 @@ class _MetadataAPI(BaseAPI):
         self._add_int(params, "page-size", page_size)
         # Load function
         def _load(page=None):
-            # Override page if it is set
+            # Copy the parameters, as pages may be loaded from several
+            # threads at once (see Page.iter_all), and override the page
+            # if it is set
+            page_params = dict(params)
             if page:
-                self._add_int(params, "page", page)
+                self._add_int(page_params, "page", page)
             # Check cache to see if we already have done this
-            cache_key = dict_to_str(params, "curves")
+            cache_key = dict_to_str(page_params, "curves")
             if self._cache.get(cache_key) is not None:
                 return self._cache[cache_key]
             # Do the HTTP request, cache the result and return
-            response = self._get("/metadata/curves/", params=params)
+            response = self._get("/metadata/curves/", params=page_params)
             items_gen = (parse_curve(c) for c in response.json())
             self._cache[cache_key] = (
                 Page._response_to_page(items_gen, response, load_func=_load)
@@ -195,15 +198,18 @@ class MetadataAPI(_MetadataAPI):
         self._add_int(params, "page-size", page_size)
         # Load function
         def _load(page=None):
-            # Override page if it is set
+            # Copy the parameters, as pages may be loaded from several
+            # threads at once (see Page.iter_all), and override the page
+            # if it is set
+            page_params = dict(params)
             if page:
-                self._add_int(params, "page", page)
+                self._add_int(page_params, "page", page)
             # Check cache to see if we already have done this
-            cache_key = dict_to_str(params, "places")
+            cache_key = dict_to_str(page_params, "places")
             if self._cache.get(cache_key):
                 return self._cache[cache_key]
             # Do the HTTP request, cache the result and return
-            response = self._get("/metadata/places/", params=params)
+            response = self._get("/metadata/places/", params=page_params)
             items_gen = (parse_place(p) for p in response.json())
             self._cache[cache_key] = (
                 Page._response_to_page(items_gen, response, load_func=_load)
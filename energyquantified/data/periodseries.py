@@ -2,6 +2,7 @@ import numbers
 import sys
 from collections import namedtuple
 from datetime import datetime
+from operator import attrgetter
 
 from .base import Series
 from .timeseries import TimeseriesList, Timeseries, Value
@@ -428,35 +429,31 @@ class _PeriodsToTimeseriesIterator:
         self.resolution = resolution
         self.begin = begin
         self.end = end
-        if field == "value":
-            self._get_value_func = lambda p: p.value
-        elif field == "installed":
-            self._get_value_func = lambda p: p.installed
+        if field in ("value", "installed"):
+            self._get_value_func = attrgetter(field)
         else:
             raise AssertionError("field must be 'value' or 'installed'")
-        # Iterator stuff
-        self.d = None
+        # Iterator stuff: the current period, and the index of the next one
+        # (instead of popping periods off the front of the list)
         self.p = None
+        self._index = 0
 
     def __iter__(self):
         # No periods available
         if not self.periods:
-            return []
+            return
         # Get first period
-        self.d = self.begin
-        self.p = self.periods.pop(0)
-        return self
-
-    def __next__(self):
-        # Get dates and current period
-        p = self.p
-        d0 = self.d
-        d1 = self.d = self.resolution >> d0
-        # We're done
-        if d0 >= self.end:
-            raise StopIteration
-        else:
-            return self._find_next_value(p, d0, d1)
+        self.p = self.periods[0]
+        self._index = 1
+        # Step through the dates up front with Resolution.enumerate() rather
+        # than shifting one step at a time, looking one date ahead to get the
+        # end of each interval
+        dates = self.resolution.enumerate(self.begin, self.end)
+        d0 = next(dates)
+        for d1 in dates:
+            yield self._find_next_value(self.p, d0, d1)
+            d0 = d1
+        yield self._find_next_value(self.p, d0, self.resolution >> d0)
 
     def _find_next_value(self, p, d0, d1):
         # No more periods
@@ -470,7 +467,7 @@ class _PeriodsToTimeseriesIterator:
             return (d0, None)
         # We are past current period
         if p.is_interval_after(d0, d1):
-            p = self.p = self.periods.pop(0) if self.periods else None
+            p = self.p = self._next_period()
             return self._find_next_value(p, d0, d1)
         # Overlapping, but not covering – find all periods covering interval
         overlapping = self._get_overlayed_periods(d0, d1)
@@ -485,10 +482,18 @@ class _PeriodsToTimeseriesIterator:
         # There are gaps, so we do not have a value
         return (d0, None)
 
+    def _next_period(self):
+        index = self._index
+        if index < len(self.periods):
+            self._index = index + 1
+            return self.periods[index]
+        return None
+
     def _get_overlayed_periods(self, begin, end):
         # Find other periods overlapping current interval
         periods = []
-        for p in self.periods:
+        for i in range(self._index, len(self.periods)):
+            p = self.periods[i]
             if p.is_overlayed(begin, end):
                 periods.append(p)
             else:
@@ -542,7 +547,18 @@ class PeriodseriesList(list):
         # Initialize list
         super().__init__(iterable)
         # Asserts
-        _validate_periodseries_list(iterable)
+        _validate_periodseries_list(self)
+
+    @classmethod
+    def _from_validated(cls, iterable):
+        """
+        Private constructor for period-based series that are known to be
+        valid already (i.e., taken from another PeriodseriesList). Skips the
+        asserts.
+        """
+        periodseries_list = cls.__new__(cls)
+        list.__init__(periodseries_list, iterable)
+        return periodseries_list
 
     def to_timeseries(self, frequency=None, field="value"):
         """
@@ -561,10 +577,14 @@ class PeriodseriesList(list):
         """
         # Verify parameters
         assert isinstance(frequency, Frequency), "Must be a frequency"
-        # Convert all period-based series to time series
-        return TimeseriesList(
-            periodseries.to_timeseries(frequency=frequency, field=field)
-            for periodseries in self
+        # Convert all period-based series to time series (all of them have
+        # the given frequency, so there is no need to validate them again)
+        return TimeseriesList._from_validated(
+            [
+                periodseries.to_timeseries(frequency=frequency, field=field)
+                for periodseries in self
+            ],
+            frequency=frequency
         )
 
     def to_df(self, frequency=None, single_level_header=False, field="value"):
@@ -625,6 +645,10 @@ class PeriodseriesList(list):
         return super().append(periodseries)
 
     def extend(self, iterable):
+        # Materialize generators and other one-shot iterables, so that they
+        # aren't consumed by the asserts
+        if not isinstance(iterable, (list, tuple)):
+            iterable = list(iterable)
         # Asserts
         _validate_periodseries_list(iterable)
         # Perform operation
@@ -638,15 +662,22 @@ class PeriodseriesList(list):
 
     def __add__(self, rhs):
         _validate_periodseries_list(rhs)
-        return PeriodseriesList(list.__add__(self, rhs))
+        return PeriodseriesList._from_validated(list.__add__(self, rhs))
 
     def __iadd__(self, rhs):
-        _validate_periodseries_list(rhs)
-        return PeriodseriesList(list.__iadd__(self, rhs))
+        # Extend in-place instead of copying the whole list on every "+="
+        self.extend(rhs)
+        return self
 
     def __setitem__(self, key, periodseries):
-        _validate_periodseries(periodseries)
-        return super().__setitem__(periodseries)
+        if isinstance(key, slice):
+            # Slice assignment takes an iterable of period-based series
+            if not isinstance(periodseries, (list, tuple)):
+                periodseries = list(periodseries)
+            _validate_periodseries_list(periodseries)
+        else:
+            _validate_periodseries(periodseries)
+        return super().__setitem__(key, periodseries)
 
     def __mul__(self, rhs):
         raise NotImplementedError("PeriodseriesList does not support multiply")
@@ -658,26 +689,29 @@ class PeriodseriesList(list):
         raise NotImplementedError("PeriodseriesList does not support multiply")
 
     def copy(self):
-        return PeriodseriesList(self)
+        return PeriodseriesList._from_validated(self)
 
     def __getitem__(self, item):
         result = list.__getitem__(self, item)
         if isinstance(result, list):
-            return PeriodseriesList(result)
+            return PeriodseriesList._from_validated(result)
         else:
             return result
 
 
 def _validate_periodseries(periodseries):
-    assert isinstance(periodseries, Periodseries), (
-        f"Element is not a Periodseries. Expects all "
-        f"elements to be Periodseries objects."
-    )
+    if not isinstance(periodseries, Periodseries):
+        raise TypeError(
+            "Element is not a Periodseries. Expects all "
+            "elements to be Periodseries objects."
+        )
 
 
 def _validate_periodseries_list(periodseries_list):
+    periodseries_class = Periodseries
     for index, periodseries in enumerate(periodseries_list):
-        assert isinstance(periodseries, Periodseries), (
-            f"Element {index} is not a Periodseries. Expects all "
-            f"elements to be Periodseries objects."
-        )
+        if not isinstance(periodseries, periodseries_class):
+            raise TypeError(
+                f"Element {index} is not a Periodseries. Expects all "
+                f"elements to be Periodseries objects."
+            )
@@ -412,7 +412,7 @@ class Timeseries(Series):
         else:
             raise ValueError("Timeseries has no values")
 
-    def to_df(self, name=None, single_level_header=False):
+    def to_df(self, name=None, single_level_header=False, dtype=None):
         """
         Alias for :meth:`Timeseries.to_dataframe`. Convert this timeseries
         to a ``pandas.DataFrame``.
@@ -422,16 +422,21 @@ class Timeseries(Series):
         :param single_level_header: Set to True to use single-level header \
             in the DataFrame, defaults to False
         :type single_level_header: boolean, optional
+        :param dtype: The floating-point data type of the values, such as \
+            ``numpy.float32`` to halve the memory use, defaults to \
+            ``numpy.float64``
+        :type dtype: numpy.dtype, optional
         :return: A DataFrame
         :rtype: pandas.DataFrame
         :raises ImportError: When pandas is not installed on the system
         """
         return self.to_dataframe(
             name=name,
-            single_level_header=single_level_header
+            single_level_header=single_level_header,
+            dtype=dtype
         )
 
-    def to_dataframe(self, name=None, single_level_header=False):
+    def to_dataframe(self, name=None, single_level_header=False, dtype=None):
         """
         Convert this timeseries to a ``pandas.DataFrame``.
 
@@ -440,6 +445,10 @@ class Timeseries(Series):
         :param single_level_header: Set to True to use single-level header \
             in the DataFrame, defaults to False
         :type single_level_header: boolean, optional
+        :param dtype: The floating-point data type of the values, such as \
+            ``numpy.float32`` to halve the memory use, defaults to \
+            ``numpy.float64``
+        :type dtype: numpy.dtype, optional
         :return: A DataFrame
         :rtype: pandas.DataFrame
         :raises ImportError: When pandas is not installed on the system
@@ -447,7 +456,8 @@ class Timeseries(Series):
         return timeseries_to_dataframe(
             self,
             name=name,
-            single_level_header=single_level_header
+            single_level_header=single_level_header,
+            dtype=dtype
         )
 
     def validate(self):
@@ -513,17 +523,25 @@ class TimeseriesList(list):
     def __init__(self, iterable=(), frequency=None):
         # Initialize list
         super().__init__(iterable)
-        # Get frequency
-        self._frequency = frequency
-        # Asserts
-        _validate_timeseries_list(self)
-        _check_and_get_frequency_list(self, self._frequency)
+        # Asserts (and find the frequency if not given)
+        self._frequency = _validate_and_check_list(self, frequency)
+
+    @classmethod
+    def _from_validated(cls, iterable, frequency=None):
+        """
+        Private constructor for time series that are known to be valid
+        already (i.e., taken from another TimeseriesList). Skips the asserts.
+        """
+        timeseries_list = cls.__new__(cls)
+        list.__init__(timeseries_list, iterable)
+        timeseries_list._frequency = frequency
+        return timeseries_list
 
     @property
     def frequency(self):
         return self._frequency
 
-    def to_df(self, single_level_header=False):
+    def to_df(self, single_level_header=False, dtype=None):
         """
         Alias for :meth:`Timeseries.to_dataframe`.
 
@@ -534,13 +552,20 @@ class TimeseriesList(list):
         :param single_level_header: Set to True to use single-level header \
             in the DataFrame, defaults to False
         :type single_level_header: boolean, optional
+        :param dtype: The floating-point data type of the values, such as \
+            ``numpy.float32`` to halve the memory use, defaults to \
+            ``numpy.float64``
+        :type dtype: numpy.dtype, optional
         :return: A DataFrame
         :rtype: pandas.DataFrame
         :raises ImportError: When pandas is not installed on the system
         """
-        return self.to_dataframe(single_level_header=single_level_header)
+        return self.to_dataframe(
+            single_level_header=single_level_header,
+            dtype=dtype
+        )
 
-    def to_dataframe(self, single_level_header=False):
+    def to_dataframe(self, single_level_header=False, dtype=None):
         """
         Convert this TimeseriesList to a ``pandas.DataFrame`` where all time
         series are placed in its own column and are lined up with the date-time
@@ -549,59 +574,66 @@ class TimeseriesList(list):
         :param single_level_header: Set to True to use single-level header \
             in the DataFrame, defaults to False
         :type single_level_header: boolean, optional
+        :param dtype: The floating-point data type of the values, such as \
+            ``numpy.float32`` to halve the memory use, defaults to \
+            ``numpy.float64``
+        :type dtype: numpy.dtype, optional
         :return: A DataFrame
         :rtype: pandas.DataFrame
         :raises ImportError: When pandas is not installed on the system
         """
         return timeseries_list_to_dataframe(
             self,
-            single_level_header=single_level_header
+            single_level_header=single_level_header,
+            dtype=dtype
         )
 
     def append(self, timeseries):
         # Asserts
-        _validate_timeseries(timeseries)
-        self._frequency = _check_and_get_frequency(timeseries, self._frequency)
+        self._frequency = _validate_and_check(timeseries, self._frequency)
         # Perform operation
         return super().append(timeseries)
 
     def extend(self, iterable):
+        # Materialize generators and other one-shot iterables, so that they
+        # aren't consumed by the asserts
+        if not isinstance(iterable, (list, tuple)):
+            iterable = list(iterable)
         # Asserts
-        _validate_timeseries_list(iterable)
-        self._frequency = _check_and_get_frequency_list(iterable,
-                                                        self._frequency)
+        self._frequency = _validate_and_check_list(iterable, self._frequency)
         # Perform operation
         return super().extend(iterable)
 
     def insert(self, index, timeseries):
         # Asserts
-        _validate_timeseries(timeseries)
-        self._frequency = _check_and_get_frequency(timeseries, self._frequency)
+        self._frequency = _validate_and_check(timeseries, self._frequency)
         # Perform operation
         return super().insert(index, timeseries)
 
     def __add__(self, rhs):
         # Asserts
-        _validate_timeseries_list(rhs)
-        self._frequency = _check_and_get_frequency_list(rhs, self._frequency)
-        # Perform operation
-        return TimeseriesList(list.__add__(self, rhs),
-                              frequency=self._frequency)
+        frequency = _validate_and_check_list(rhs, self._frequency)
+        # Perform operation (both sides are validated already)
+        return TimeseriesList._from_validated(list.__add__(self, rhs),
+                                              frequency=frequency)
 
     def __iadd__(self, rhs):
-        # Asserts
-        _validate_timeseries_list(rhs)
-        self._frequency = _check_and_get_frequency_list(rhs, self._frequency)
-        # Perform operation
-        return TimeseriesList(list.__iadd__(self, rhs),
-                              frequency=self._frequency)
+        # Extend in-place instead of copying the whole list on every "+="
+        self.extend(rhs)
+        return self
 
     def __setitem__(self, key, timeseries):
         # Asserts
-        _validate_timeseries(timeseries)
-        self._frequency = _check_and_get_frequency(timeseries, self._frequency)
+        if isinstance(key, slice):
+            # Slice assignment takes an iterable of time series
+            if not isinstance(timeseries, (list, tuple)):
+                timeseries = list(timeseries)
+            self._frequency = _validate_and_check_list(timeseries,
+                                                       self._frequency)
+        else:
+            self._frequency = _validate_and_check(timeseries, self._frequency)
         # Perform operation
-        return super().__setitem__(timeseries)
+        return super().__setitem__(key, timeseries)
 
     def __mul__(self, rhs):
         raise NotImplementedError("TimeseriesList does not support multiply")
@@ -613,51 +645,48 @@ class TimeseriesList(list):
         raise NotImplementedError("TimeseriesList does not support multiply")
 
     def copy(self):
-        return TimeseriesList(self, frequency=self._frequency)
+        return TimeseriesList._from_validated(self, frequency=self._frequency)
 
     def __getitem__(self, item):
         result = list.__getitem__(self, item)
         if isinstance(result, list):
-            return TimeseriesList(result, frequency=self._frequency)
+            return TimeseriesList._from_validated(result,
+                                                  frequency=self._frequency)
         else:
             return result
 
 
-def _find_frequency(timeseries_list):
-    if timeseries_list:
-        return timeseries_list[0].resolution.frequency
-    return None
-
-
-def _check_and_get_frequency(timeseries, frequency=None):
-    if frequency:
-        assert timeseries.resolution.frequency == frequency, (
+def _validate_and_check(timeseries, frequency=None):
+    if not isinstance(timeseries, Timeseries):
+        raise TypeError(
+            "Element is not a Timeseries. Expects all "
+            "elements to be Timeseries objects."
+        )
+    if frequency is None:
+        return timeseries.resolution.frequency
+    if timeseries.resolution.frequency != frequency:
+        raise ValueError(
             f"Items in TimeseriesList must have frequency {frequency}, but "
             f"the Timeseries has {timeseries.resolution.frequency}."
         )
+    return frequency
 
 
-def _check_and_get_frequency_list(timeseries_list, frequency=None):
-    if not frequency:
-        frequency = _find_frequency(timeseries_list)
-    if frequency:
-        for index, timeseries in enumerate(timeseries_list):
-            assert timeseries.resolution.frequency == frequency, (
+def _validate_and_check_list(timeseries_list, frequency=None):
+    # Single pass: check the type and frequency of each element, and pick up
+    # the frequency from the first element if it isn't known yet
+    timeseries_class = Timeseries
+    for index, timeseries in enumerate(timeseries_list):
+        if not isinstance(timeseries, timeseries_class):
+            raise TypeError(
+                f"Element {index} is not a Timeseries. Expects all "
+                f"elements to be Timeseries objects."
+            )
+        if frequency is None:
+            frequency = timeseries.resolution.frequency
+        elif timeseries.resolution.frequency != frequency:
+            raise ValueError(
                 f"Element {index} does not match the frequency of "
                 f"the other Timeseries objects."
             )
-
-
-def _validate_timeseries(timeseries):
-    assert isinstance(timeseries, Timeseries), (
-        f"Element is not a Timeseries. Expects all "
-        f"elements to be Timeseries objects."
-    )
-
-
-def _validate_timeseries_list(timeseries_list):
-    for index, timeseries in enumerate(timeseries_list):
-        assert isinstance(timeseries, Timeseries), (
-            f"Element {index} is not a Timeseries. Expects all "
-            f"elements to be Timeseries objects."
-        )
+    return frequency
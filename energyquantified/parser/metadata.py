@@ -8,7 +8,7 @@ from ..metadata import (
     Subscription, SubscriptionAccess, SubscriptionType, SubscriptionCollectionPerm
 )
 from ..time import Frequency, Resolution, UTC, to_timezone
-from ..time.timezone import LOCAL_TZ
+from ..time.timezone import local_tz
 
 
 def parse_resolution(json):
@@ -103,7 +103,7 @@ def parse_instance(json, curve=None):
     if curve and curve.timezone:
         curve_timezone = curve.timezone
     else:
-        curve_timezone = LOCAL_TZ
+        curve_timezone = local_tz()
     # Created and modified
     created = json.get("created") or None
     if created:
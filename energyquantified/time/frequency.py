@@ -1,20 +1,18 @@
 import enum
+from datetime import timedelta
+from types import MappingProxyType
 
 from dateutil.relativedelta import relativedelta
 
 from .helpers import (
-    shift,
+    shift, _steps_between_months, _steps_between_duration,
     truncate_second, truncate_5min, truncate_10min,
     truncate_15min, truncate_30min, truncate_hour, truncate_date,
     truncate_week, truncate_month, truncate_quarter, truncate_year,
-    truncate_season
+    truncate_season, TRUNCATE_SPECIALIZATIONS
 )
 
 
-# Lookup dict for frequencies by tag
-_frequencies_lookup = {}
-
-
 class Frequency(enum.Enum):
     """
     Enumerator of valid frequencies for Energy Quantified's API. The
@@ -56,10 +54,19 @@ class Frequency(enum.Enum):
         self.ordinal = len(self.__class__.__members__) + 1
         self.field = field
         self.steps = steps
-        self.delta = relativedelta(**{ field: steps }) if is_iterable else None
+        if not is_iterable:
+            self.delta = None
+        elif field in ("years", "months"):
+            self.delta = relativedelta(**{ field: steps })
+        else:
+            # Fixed-length steps don't need the overhead of relativedelta
+            self.delta = timedelta(**{ field: steps })
         self.truncate_func = truncate_func
+        # Variant of truncate_func for datetime-only input
+        self.truncate_dt = TRUNCATE_SPECIALIZATIONS.get(
+            truncate_func, truncate_func
+        )
         self.pretty_name = pretty_name
-        _frequencies_lookup[self.name.lower()] = self
 
     @classmethod
     def by_tag(cls, tag):
@@ -71,7 +78,11 @@ class Frequency(enum.Enum):
         :return: A Frequency for this tag
         :rtype: Frequency
         """
-        return _frequencies_lookup[tag.lower()]
+        # Tags from the API are upper case, so try without lower() first
+        frequency = LOOKUP.get(tag)
+        if frequency is not None:
+            return frequency
+        return LOOKUP[tag.lower()]
 
     @classmethod
     def is_valid_tag(cls, tag):
@@ -83,7 +94,12 @@ class Frequency(enum.Enum):
         :return: True if the frequency tag exists, otherwise False
         :rtype: bool
         """
-        return tag.lower() in _frequencies_lookup
+        return tag in LOOKUP or tag.lower() in LOOKUP
+
+    def __reduce_ex__(self, protocol):
+        # Pickle members by name, as the member values hold truncate functions
+        # (partials and lambdas) that can't be looked up by value again
+        return getattr, (self.__class__, self.name)
 
     def __lt__(self, b): return self.ordinal < b.ordinal
     def __gt__(self, b): return self.ordinal > b.ordinal
@@ -128,18 +144,21 @@ class Frequency(enum.Enum):
 
     def get_delta(self, num_steps):
         """
-        Create a relativedelta of N steps in this frequency. 0 steps
+        Create a delta of N steps in this frequency. 0 steps
         means no change. 1 step means one tick forward, -1 step means one
         tick backwards.
 
         :param num_steps: Number of steps forward (positive) or backwards\
                           (negative)
         :type num_steps: int
-        :return: A relativedelta (similar to timedelta)
-        :rtype: relativedelta
+        :return: A relativedelta for monthly and yearly frequencies,\
+                 otherwise a timedelta
+        :rtype: relativedelta, timedelta
         """
         # Requires an iterable frequency
         assert self.is_iterable, "%s is not iterable" % self
+        if isinstance(self.delta, timedelta):
+            return self.delta * num_steps
         return relativedelta(**{ self.field: self.steps * num_steps })
 
     def shift(self, datetime_obj, num_steps):
@@ -180,26 +199,12 @@ class Frequency(enum.Enum):
         # Same date
         if d1 == d2:
             return 0
-        # Initiate counters and deltas
-        delta = self.get_delta(1)
-        d = d1
-        i = 0
-        # Forwards or backwards
-        if d1 < d2:
-            while d < d2:
-                d = d + delta
-                i = i + 1
-        else:
-            while d > d2:
-                d = d - delta
-                i = i - 1
-        # The conclusion
-        return i
-
-
-# Additional lookups for
-
-_frequencies_lookup["pt60m"] = Frequency.PT1H
+        # Count in constant time instead of adding the delta step by step
+        if self.field == "years":
+            return _steps_between_months(d1, d2, self.steps * 12)
+        if self.field == "months":
+            return _steps_between_months(d1, d2, self.steps)
+        return _steps_between_duration(d1, d2, self.delta)
 
 
 # Constants
@@ -219,8 +224,15 @@ P3M    = Frequency.P3M
 SEASON = Frequency.SEASON
 P1Y    = Frequency.P1Y
 
+# Ordinal of the shortest frequency that is daily or longer
+_P1D_ORDINAL = P1D.ordinal
+
 
-# Lookup
+# Lookup for frequencies by tag (in upper case or lower case)
 
-LOOKUP = { str(f): f for f in list(Frequency) }
-LOOKUP["PT60M"] = PT1H
+LOOKUP = MappingProxyType({
+    **{ f.name.lower(): f for f in Frequency },
+    **{ f.name: f for f in Frequency },
+    "pt60m": PT1H,
+    "PT60M": PT1H,
+})
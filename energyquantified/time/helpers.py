@@ -1,8 +1,27 @@
+from bisect import bisect_right
+from calendar import monthrange
 from datetime import datetime, timedelta
+from functools import partial
 
-from dateutil.relativedelta import relativedelta
+from .timezone import UTC
 
-from .utils import is_tz_aware
+
+_ONE_HOUR = timedelta(hours=1)
+
+
+def _add_months(datetime_obj, months):
+    """
+    Add a number of months to a date or datetime, like a relativedelta
+    does: the day-of-month is clamped to the length of the new month and
+    the tzinfo is kept as-is (not normalized).
+    """
+    if months == 0:
+        return datetime_obj
+    year, month = divmod(datetime_obj.month - 1 + months, 12)
+    year += datetime_obj.year
+    month += 1
+    day = min(datetime_obj.day, monthrange(year, month)[1])
+    return datetime_obj.replace(year=year, month=month, day=day)
 
 
 def shift(
@@ -20,26 +39,38 @@ def shift(
     Shift a date by a certain amount of time, using a timedelta
     under the hood, while normalizing the tzinfo.
     """
-    # Make the delta
-    delta = relativedelta(
-        years=years,
-        months=months,
+    # Make the delta (months are added separately, see _add_months)
+    delta = timedelta(
         weeks=weeks,
         days=days,
         hours=hours,
         minutes=minutes,
         seconds=seconds,
-        microseconds=millis * 1000,
+        milliseconds=millis,
     )
-    if years != 0 or months != 0 or weeks != 0 or days != 0:
+    months = years * 12 + months
+    if months != 0 or weeks != 0 or days != 0:
+        tz = datetime_obj.tzinfo
+        # Fast path: Add the delta to the wall-clock time and normalize. This
+        # is correct when the UTC offset is the same before and after, unless
+        # the result is in the repeated hour at the end of DST (where localize
+        # picks standard time), so check that the offset is stable an hour on
+        offset = datetime_obj.utcoffset()
+        candidate = tz.normalize(_add_months(datetime_obj, months) + delta)
+        if (
+                candidate.utcoffset() == offset
+                and tz.normalize(candidate + _ONE_HOUR).utcoffset() == offset
+        ):
+            return candidate
         # Do arithmetic in without timezone info, then localize when done
-        tz, dt_naive = datetime_obj.tzinfo, datetime_obj.replace(tzinfo=None)
-        dt_naive = dt_naive + delta
+        dt_naive = datetime_obj.replace(tzinfo=None)
+        dt_naive = _add_months(dt_naive, months) + delta
         return tz.localize(dt_naive)
     else:
         # Add delta and normalize datetime if tzinfo is attached
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(datetime_obj + delta)
+        tz = datetime_obj.tzinfo
+        if tz is not None and tz is not UTC:
+            return tz.normalize(datetime_obj + delta)
         return datetime_obj + delta
 
 
@@ -48,97 +79,132 @@ def replace(datetime_obj, **kwargs):
     Replaces fields of a datetime while normalizing the tzinfo. All
     kwargs will be passed on to datetime.replace.
     """
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(datetime_obj.replace(**kwargs))
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(datetime_obj.replace(**kwargs))
     return datetime_obj.replace(**kwargs)
 
 
-def truncate_second(datetime_obj):
+def _enumerate_fixed_steps(begin, end, delta):
     """
-    Truncates and returns new a datetime to seconds.
+    Yield the timezone-aware `begin`, `begin + delta`, `begin + 2 * delta`,
+    ... up to (excluding) `end`, like normalizing after every step would.
 
-    Keeps the timezone of the datetime. Works for timezone naive objects, too.
+    The UTC offset only changes at the transitions in the pytz timezone, so
+    the delta is added directly and the date-times are only normalized when
+    passing a transition. Comparisons are done on naive UTC date-times.
     """
-    d = datetime_obj.replace(microsecond=0)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
-    return d
-
-
-def truncate_minute(datetime_obj):
+    if not begin < end:
+        return
+    yield begin
+    normalize = begin.tzinfo.normalize
+    transitions = getattr(begin.tzinfo, "_utc_transition_times", None) or ()
+    num_transitions = len(transitions)
+    d = normalize(begin + delta)
+    utc = d.replace(tzinfo=None) - d.utcoffset()
+    utc_end = end.replace(tzinfo=None) - end.utcoffset()
+    index = bisect_right(transitions, utc)
+    next_transition = (
+        transitions[index] if index < num_transitions else datetime.max
+    )
+    while utc < utc_end:
+        yield d
+        d = d + delta
+        utc = utc + delta
+        if utc >= next_transition:
+            d = normalize(d)
+            index = bisect_right(transitions, utc)
+            next_transition = (
+                transitions[index] if index < num_transitions else datetime.max
+            )
+
+
+def _steps_between_months(d1, d2, step_months):
     """
-    Truncates and returns new a datetime to minutes.
-
-    Keeps the timezone of the datetime. Works for timezone naive objects, too.
+    Count the number of `step_months` month steps from `d1` until `d2` is
+    reached, the same way as adding (or subtracting) the step to `d1` over
+    and over again would: keeping the UTC offset of `d1`.
     """
-    d = datetime_obj.replace(microsecond=0, second=0)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
-    return d
+    w1, w2 = d1, d2
+    if isinstance(d1, datetime) and d1.tzinfo is not None:
+        # Wall-clock times in the UTC offset of d1
+        offset = d1.utcoffset()
+        w1 = d1.replace(tzinfo=None)
+        w2 = d2.replace(tzinfo=None) - d2.utcoffset() + offset
+    months = (w2.year - w1.year) * 12 + (w2.month - w1.month)
+    if w1 < w2:
+        # Start right below the answer and step forward
+        i = max(months // step_months - 1, 1)
+        while _add_months(w1, i * step_months) < w2:
+            i += 1
+        return i
+    else:
+        i = max(-months // step_months - 1, 1)
+        while _add_months(w1, -i * step_months) > w2:
+            i += 1
+        return -i
 
 
-def truncate_5min(datetime_obj):
+def _steps_between_duration(d1, d2, step):
     """
-    Truncates and returns new a datetime to 5 minutes (:00, :05, :10, ...).
-
-    Keeps the timezone of the datetime. Works for timezone naive objects, too.
+    Count the number of fixed-length `step` (a timedelta) steps from `d1`
+    until `d2` is reached.
     """
-    m = (datetime_obj.minute // 5) * 5
-    d = datetime_obj.replace(microsecond=0, second=0, minute=m)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
-    return d
+    if d1 < d2:
+        # Number of steps, rounded up
+        return -((d1 - d2) // step)
+    else:
+        return (d2 - d1) // step
 
 
-def truncate_10min(datetime_obj):
+def truncate_second(datetime_obj):
     """
-    Truncates and returns new a datetime to 10 minutes (:00, :10, :20, ...).
+    Truncates and returns new a datetime to seconds.
 
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
-    m = (datetime_obj.minute // 10) * 10
-    d = datetime_obj.replace(microsecond=0, second=0, minute=m)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
+    d = datetime_obj.replace(microsecond=0)
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
     return d
 
 
-def truncate_15min(datetime_obj):
+def _truncate_minute_mod(datetime_obj, m_step):
     """
-    Truncates and returns new a datetime to 15 minutes (:00, :15, :30, :45).
+    Truncates and returns new a datetime to the nearest multiple of
+    `m_step` minutes below it (:00, :05, :10, ... for `m_step=5`).
 
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
-    m = (datetime_obj.minute // 15) * 15
+    m = (datetime_obj.minute // m_step) * m_step
     d = datetime_obj.replace(microsecond=0, second=0, minute=m)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
     return d
 
 
-def truncate_30min(datetime_obj):
-    """
-    Truncates and returns new a datetime to 30 minutes (:00, :30).
+# Truncate to minutes, 5 minutes (:00, :05, :10, ...), 10 minutes (:00, :10,
+# :20, ...), 15 minutes (:00, :15, :30, :45), 30 minutes (:00, :30) and hours
+truncate_minute = partial(_truncate_minute_mod, m_step=1)
+truncate_5min = partial(_truncate_minute_mod, m_step=5)
+truncate_10min = partial(_truncate_minute_mod, m_step=10)
+truncate_15min = partial(_truncate_minute_mod, m_step=15)
+truncate_30min = partial(_truncate_minute_mod, m_step=30)
+truncate_hour = partial(_truncate_minute_mod, m_step=60)
 
-    Keeps the timezone of the datetime. Works for timezone naive objects, too.
-    """
-    m = (datetime_obj.minute // 30) * 30
-    d = datetime_obj.replace(microsecond=0, second=0, minute=m)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
+
+def _truncate_date_dt(datetime_obj):
+    d = datetime_obj.replace(microsecond=0, second=0, minute=0, hour=0)
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
     return d
 
 
-def truncate_hour(datetime_obj):
-    """
-    Truncates and returns new a datetime to hours.
-
-    Keeps the timezone of the datetime. Works for timezone naive objects, too.
-    """
-    d = datetime_obj.replace(microsecond=0, second=0, minute=0)
-    if is_tz_aware(datetime_obj):
-        return datetime_obj.tzinfo.normalize(d)
-    return d
+def _truncate_date_date(date_obj):
+    return date_obj
 
 
 def truncate_date(datetime_obj):
@@ -149,14 +215,22 @@ def truncate_date(datetime_obj):
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
     if isinstance(datetime_obj, datetime):
-        # Datetime
-        d = datetime_obj.replace(microsecond=0, second=0, minute=0, hour=0)
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(d)
-        return d
-    else:
-        # Date
-        return datetime_obj
+        return _truncate_date_dt(datetime_obj)
+    return _truncate_date_date(datetime_obj)
+
+
+def _truncate_week_dt(datetime_obj):
+    days_from_monday = datetime_obj.isoweekday() - 1
+    d = datetime_obj.replace(microsecond=0, second=0, minute=0, hour=0)
+    d = d - timedelta(days=days_from_monday)
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
+    return d
+
+
+def _truncate_week_date(date_obj):
+    return date_obj - timedelta(days=date_obj.isoweekday() - 1)
 
 
 def truncate_week(datetime_obj):
@@ -166,18 +240,21 @@ def truncate_week(datetime_obj):
 
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
-    days_from_monday = datetime_obj.isoweekday() - 1
-    # Date
     if isinstance(datetime_obj, datetime):
-        # Datetime
-        d = datetime_obj.replace(microsecond=0, second=0, minute=0, hour=0)
-        d = d - timedelta(days=days_from_monday)
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(d)
-        return d
-    else:
-        # Date
-        return datetime_obj - timedelta(days=days_from_monday)
+        return _truncate_week_dt(datetime_obj)
+    return _truncate_week_date(datetime_obj)
+
+
+def _truncate_month_dt(datetime_obj):
+    d = datetime_obj.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
+    return d
+
+
+def _truncate_month_date(date_obj):
+    return date_obj.replace(day=1)
 
 
 def truncate_month(datetime_obj):
@@ -188,15 +265,25 @@ def truncate_month(datetime_obj):
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
     if isinstance(datetime_obj, datetime):
-        # Datetime
-        d = datetime_obj.replace(microsecond=0, second=0, minute=0, hour=0,
-                                 day=1)
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(d)
-        return d
-    else:
-        # Date
-        return datetime_obj.replace(day=1)
+        return _truncate_month_dt(datetime_obj)
+    return _truncate_month_date(datetime_obj)
+
+
+def _truncate_quarter_dt(datetime_obj):
+    month = datetime_obj.month
+    new_month = month - ((month - 1) % 3)
+    d = datetime_obj.replace(
+        microsecond=0, second=0, minute=0, hour=0, day=1, month=new_month
+    )
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
+    return d
+
+
+def _truncate_quarter_date(date_obj):
+    month = date_obj.month
+    return date_obj.replace(day=1, month=month - ((month - 1) % 3))
 
 
 def truncate_quarter(datetime_obj):
@@ -206,19 +293,41 @@ def truncate_quarter(datetime_obj):
 
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
-    month = datetime_obj.month
-    new_month = month - ((month - 1) % 3)
     if isinstance(datetime_obj, datetime):
-        # Datetime
-        d = datetime_obj.replace(
-            microsecond=0, second=0, minute=0, hour=0, day=1, month=new_month
-        )
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(d)
-        return d
+        return _truncate_quarter_dt(datetime_obj)
+    return _truncate_quarter_date(datetime_obj)
+
+
+def _season_start(year, month):
+    """
+    Get the (year, month) of the first month in the season that the given
+    year and month belongs to.
+    """
+    new_month = month - ((month - 1) % 3)
+    # Check the various months
+    if new_month == 1:
+        return year - 1, 10
+    elif new_month == 10:
+        return year, 10
     else:
-        # Date
-        return datetime_obj.replace(day=1, month=new_month)
+        return year, 4
+
+
+def _truncate_season_dt(datetime_obj):
+    year, month = _season_start(datetime_obj.year, datetime_obj.month)
+    d = datetime_obj.replace(
+        microsecond=0, second=0, minute=0, hour=0, day=1, month=month,
+        year=year
+    )
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
+    return d
+
+
+def _truncate_season_date(date_obj):
+    year, month = _season_start(date_obj.year, date_obj.month)
+    return date_obj.replace(day=1, month=month, year=year)
 
 
 def truncate_season(datetime_obj):
@@ -228,30 +337,23 @@ def truncate_season(datetime_obj):
 
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
-    month = datetime_obj.month
-    year = datetime_obj.year
-    new_month = month - ((month - 1) % 3)
-    # Check the various months
-    if new_month == 1:
-        new_month = 10
-        year = year - 1
-    elif new_month == 10:
-        pass
-    else:
-        new_month = 4
-    # Handle date and datetime objects differently
     if isinstance(datetime_obj, datetime):
-        # Datetime
-        d = datetime_obj.replace(
-            microsecond=0, second=0, minute=0, hour=0, day=1, month=new_month,
-            year=year
-        )
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(d)
-        return d
-    else:
-        # Date
-        return datetime_obj.replace(day=1, month=new_month, year=year)
+        return _truncate_season_dt(datetime_obj)
+    return _truncate_season_date(datetime_obj)
+
+
+def _truncate_year_dt(datetime_obj):
+    d = datetime_obj.replace(
+        microsecond=0, second=0, minute=0, hour=0, day=1, month=1
+    )
+    tz = datetime_obj.tzinfo
+    if tz is not None and tz is not UTC:
+        return tz.normalize(d)
+    return d
+
+
+def _truncate_year_date(date_obj):
+    return date_obj.replace(day=1, month=1)
 
 
 def truncate_year(datetime_obj):
@@ -262,13 +364,17 @@ def truncate_year(datetime_obj):
     Keeps the timezone of the datetime. Works for timezone naive objects, too.
     """
     if isinstance(datetime_obj, datetime):
-        # Datetime
-        d = datetime_obj.replace(
-            microsecond=0, second=0, minute=0, hour=0, day=1, month=1
-        )
-        if is_tz_aware(datetime_obj):
-            return datetime_obj.tzinfo.normalize(d)
-        return d
-    else:
-        # Date
-        return datetime_obj.replace(day=1, month=1)
+        return _truncate_year_dt(datetime_obj)
+    return _truncate_year_date(datetime_obj)
+
+
+# Lookup of datetime-only variants of the truncate functions above, for
+# callers that only ever pass datetimes (such as Resolution)
+TRUNCATE_SPECIALIZATIONS = {
+    truncate_date: _truncate_date_dt,
+    truncate_week: _truncate_week_dt,
+    truncate_month: _truncate_month_dt,
+    truncate_quarter: _truncate_quarter_dt,
+    truncate_season: _truncate_season_dt,
+    truncate_year: _truncate_year_dt,
+}
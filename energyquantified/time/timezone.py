@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pytz
 import tzlocal
 
@@ -11,12 +13,14 @@ CET = pytz.timezone("CET")
 WET = pytz.timezone("WET")
 EET = pytz.timezone("EET")
 TRT = pytz.timezone("Europe/Istanbul")
+# Built on import, as it also registers "Europe/Gas_Day" in pytz
 GAS_DAY = _build_europe_gas_day_tzinfo()
 
 
+@lru_cache(maxsize=None)
 def local_tz():
     """
-    Get the local timezone.
+    Get the local timezone. It is looked up once and then cached.
 
     :return: The timezone for this system.
     :rtype: TzInfo
@@ -24,6 +28,27 @@ def local_tz():
     return tzlocal.get_localzone()
 
 
+# Timezones supported by the API
+_VALID_TIMEZONES = frozenset((UTC, CET, WET, EET, TRT, GAS_DAY))
+
+
+@lru_cache(maxsize=128)
+def _is_valid_timezone_name(name):
+    """
+    Check if a timezone name is the name of a valid timezone. Results are
+    cached, as looking up a timezone in pytz is relatively slow.
+
+    :param name: Timezone name to check
+    :type name: str, required
+    :return: True if name is a valid timezone, else False
+    :rtype: bool
+    """
+    try:
+        return pytz.timezone(name) in _VALID_TIMEZONES
+    except pytz.exceptions.UnknownTimeZoneError:
+        return False
+
+
 def _is_valid_timezone(tz):
     """
     Check if a timezone is a valid timezone.
@@ -36,16 +61,24 @@ def _is_valid_timezone(tz):
     if tz is None:
         return False
     if isinstance(tz, str):
-        try:
-            tz = pytz.timezone(tz)
-        except pytz.exceptions.UnknownTimeZoneError:
-            return False
+        return _is_valid_timezone_name(tz)
     if isinstance(tz, pytz.tzinfo.BaseTzInfo):
-        return tz in (UTC, CET, WET, EET, TRT, GAS_DAY)
+        return tz in _VALID_TIMEZONES
     return False
 
 
 # Default timezone
 
 DEFAULT_TZ = CET
-LOCAL_TZ = local_tz()
+
+
+def __getattr__(name):
+    """
+    Look up ``LOCAL_TZ`` on first access rather than on import, as finding
+    the local timezone requires inspecting the system configuration.
+    """
+    if name == "LOCAL_TZ":
+        tz = local_tz()
+        globals()[name] = tz
+        return tz
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,13 @@
-import time
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 
 from .timezone import DEFAULT_TZ, UTC
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+
+
 def now(tz=DEFAULT_TZ):
     """
     Get the current datetime.
@@ -26,9 +30,10 @@ def today(tz=DEFAULT_TZ):
     :rtype: datetime
     """
 
-    dt = now(tz=tz)
-    dt = dt.replace(microsecond=0, second=0, minute=0, hour=0)
-    return dt.tzinfo.normalize(dt)
+    # Localize midnight directly, so that it gets its own UTC offset (which
+    # differs from the current one on days with a DST change)
+    midnight = datetime.combine(datetime.now(tz=tz).date(), time())
+    return tz.localize(midnight)
 
 
 def get_date(year=None, month=1, day=1):
@@ -44,8 +49,10 @@ def get_date(year=None, month=1, day=1):
     :type day: int, optional
     :return: A date
     :rtype: date
+    :raises ValueError: When year is missing or not in 1900-2100
     """
-    assert year and 1900 <= year <= 2100, "Must specify year (1900-2100)"
+    if not (year and 1900 <= year <= 2100):
+        raise ValueError("Must specify year (1900-2100)")
     return date(year, month, day)
 
 
@@ -73,10 +80,24 @@ def get_datetime(year=None, month=1, day=1, hour=0, minute=0, second=0,
     :type tz: TzInfo (or similar pytz timezone)
     :return: A timezone aware datetime
     :rtype: datetime
+    :raises ValueError: When year is missing or not in 1900-2100
     """
+    if not (year and 1900 <= year <= 2100):
+        raise ValueError("Must specify year (1900-2100)")
+    if tz is UTC or tz is timezone.utc:
+        # No UTC offset to look up
+        return datetime(year, month, day, hour, minute, second, millis * 1000,
+                        tzinfo=tz)
+    return _localize(tz, year, month, day, hour, minute, second, millis * 1000)
+
 
-    assert year and 1900 <= year <= 2100, "Must specify year (1900-2100)"
-    dt = datetime(year, month, day, hour, minute, second, millis * 1000)
+@lru_cache(maxsize=4096)
+def _localize(tz, year, month, day, hour, minute, second, microsecond):
+    """
+    Create a timezone-aware datetime. Results are cached, as localizing
+    with pytz looks up the UTC offset in the timezone's transition table.
+    """
+    dt = datetime(year, month, day, hour, minute, second, microsecond)
     return tz.localize(dt)
 
 
@@ -85,13 +106,9 @@ def to_millis(datetime_obj):
     Convert a datetime object to milliseconds since epoch.
     """
     assert is_tz_aware(datetime_obj), "Must be timezone-aware"
-    # First convert to UTC
-    utc_dt = datetime_obj.astimezone(UTC)
-    # Get seconds since epoch and fraction of a second in millis
-    seconds = int(time.mktime(utc_dt.timetuple()) * 1000)
-    millis_fraction = utc_dt.microsecond // 1000
-    # Tada!
-    return seconds + millis_fraction
+    # Exact integer arithmetic on the instant (no float rounding, and no
+    # conversion through the local timezone of the system)
+    return (datetime_obj - _EPOCH) // _ONE_MILLISECOND
 
 
 def from_millis(millis, tz=DEFAULT_TZ):
@@ -109,8 +126,12 @@ def to_timezone(datetime_obj, tz=DEFAULT_TZ):
     Make a datetime object timezone-aware in given timezone. If it already
     has a timezone, convert the instant to provided timezone.
     """
+    if datetime_obj.tzinfo is tz:
+        return datetime_obj
     if is_tz_aware(datetime_obj):
         return datetime_obj.astimezone(tz)
+    if tz is UTC:
+        return datetime_obj.replace(tzinfo=UTC)
     return tz.localize(datetime_obj)
 
 
@@ -119,14 +140,19 @@ def is_tz_aware(datetime_obj):
     Check whether a datetime_obj is timezone-aware or not.
     """
     tz = datetime_obj.tzinfo
-    return tz is not None and tz.utcoffset(datetime_obj) is not None
+    if tz is None:
+        return False
+    if tz is UTC or tz is timezone.utc:
+        return True
+    return tz.utcoffset(datetime_obj) is not None
 
 
 def is_tz_naive(datetime_obj):
     """
     Check whether a datetime_obj is timezone-naive.
     """
-    return not is_tz_aware(datetime_obj)
+    tz = datetime_obj.tzinfo
+    return tz is None or tz.utcoffset(datetime_obj) is None
 
 
 def is_in_timezone(datetime_obj, tz):
@@ -3,6 +3,8 @@ class User:
     User details.
     """
 
+    __slots__ = ("name", "email", "organization", "subscriptions")
+
     def __init__(self, name, email, organization, subscriptions):
         #: The name of the user, str
         self.name = name
@@ -26,6 +28,8 @@ class Organization:
     Organization details.
     """
 
+    __slots__ = ("name", "account_manager")
+
     def __init__(self, name, account_manager):
         #: The name of the organization
         self.name = name
@@ -44,6 +48,8 @@ class AccountManager:
     Account manager details.
     """
 
+    __slots__ = ("name", "email")
+
     def __init__(self, name, email):
         #: The name of the account manager
         self.name = name
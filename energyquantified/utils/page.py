@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from ..exceptions import PageError
 
@@ -12,6 +13,16 @@ class Page(list):
     print the page to stdout.
     """
 
+    __slots__ = (
+        "page",
+        "page_size",
+        "total_items",
+        "first_page",
+        "last_page",
+        "total_pages",
+        "_page_load_func",
+    )
+
     def __init__(
             self,
             elements,
@@ -111,6 +122,34 @@ class Page(list):
             raise PageError("Cannot load more pages")
         return self._page_load_func(page=self.page + 1)
 
+    def iter_all(self, prefetch=True):
+        """
+        Iterate over the items on this page and all the following pages.
+        Loads the following pages one by one as they are needed.
+
+        :param prefetch: Load the next page in a background thread while the \
+            items on the current page are processed, defaults to True
+        :type prefetch: bool, optional
+        :raises PageError: There is no support for loading the next page
+        :yield: All items on this and the following pages
+        """
+        page = self
+        if not prefetch:
+            while True:
+                yield from page
+                if not page.has_next_page():
+                    return
+                page = page.get_next_page()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                future = None
+                if page.has_next_page():
+                    future = executor.submit(page.get_next_page)
+                yield from page
+                if future is None:
+                    return
+                page = future.result()
+
     def get_previous_page(self):
         """
         Get the previous page. Will perform an HTTP request if data is not
@@ -134,17 +173,18 @@ class Page(list):
         :param file: A file descriptor, defaults to sys.stdout
         :type file: file descriptor, optional
         """
-        print(
-            f"Page:\n"
-            f"   current = {self.page}\n"
-            f"   page-size = {self.page_size}\n"
-            f"   total-items = {self.total_items}\n"
-            f"   total-pages = {self.total_pages}\n"
-            f"   items:\n",
-            file=file
-        )
-        for item in self:
-            print("    –", item, file=file)
+        # Build the whole text first and write it in one go
+        lines = [
+            "Page:",
+            f"   current = {self.page}",
+            f"   page-size = {self.page_size}",
+            f"   total-items = {self.total_items}",
+            f"   total-pages = {self.total_pages}",
+            "   items:",
+            "",
+        ]
+        lines.extend(f"    – {item}" for item in self)
+        file.write("\n".join(lines) + "\n")
 
     @staticmethod
     def _response_to_page(items, response, load_func=None):
@@ -154,11 +194,9 @@ class Page(list):
         """
         # Parse pagination from response headers
         headers = response.headers
-        page = int(headers.get("X-Current-Page"))
-        page_size = int(headers.get("X-Page-Size"))
-        first_page = int(headers.get("X-First-Page"))
-        last_page = int(headers.get("X-Last-Page"))
-        total_items = int(headers.get("X-Total-Items"))
+        page, page_size, first_page, last_page, total_items = (
+            int(headers.get(key)) for key in _PAGINATION_HEADERS
+        )
         # To a page instance
         return Page(
             items,
@@ -169,3 +207,12 @@ class Page(list):
             total_items=total_items,
             page_load_func=load_func
         )
+
+
+_PAGINATION_HEADERS = (
+    "X-Current-Page",
+    "X-Page-Size",
+    "X-First-Page",
+    "X-Last-Page",
+    "X-Total-Items",
+)
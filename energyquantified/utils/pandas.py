@@ -1,4 +1,8 @@
-_timeseries_class = None
+from functools import lru_cache
+from itertools import chain
+
+
+@lru_cache(maxsize=None)
 def _get_timeseries_class():
     """
     Private utility function for lazy-loading the Timeseries class.
@@ -6,13 +10,11 @@ def _get_timeseries_class():
     :return: The Timeseries class
     :rtype: class
     """
-    global _timeseries_class
-    if not _timeseries_class:
-        from energyquantified.data import Timeseries
-        _timeseries_class = Timeseries
-    return _timeseries_class
+    from energyquantified.data import Timeseries
+    return Timeseries
+
 
-_ohlc_list_class = None
+@lru_cache(maxsize=None)
 def _get_ohlc_list_class():
     """
     Private utility function for lazy-loading the OHLCList class.
@@ -20,13 +22,11 @@ def _get_ohlc_list_class():
     :return: The OHLCList class
     :rtype: class
     """
-    global _ohlc_list_class
-    if not _ohlc_list_class:
-        from energyquantified.data import OHLCList
-        _ohlc_list_class = OHLCList
-    return _ohlc_list_class
+    from energyquantified.data import OHLCList
+    return OHLCList
 
-_value_type_class = None
+
+@lru_cache(maxsize=None)
 def _get_value_type_class():
     """
     Private utility function for lazy-loading the ValueType enum class.
@@ -34,13 +34,11 @@ def _get_value_type_class():
     :return: The ValueType class
     :rtype: class
     """
-    global _value_type_class
-    if not _value_type_class:
-        from energyquantified.data import ValueType
-        _value_type_class = ValueType
-    return _value_type_class
+    from energyquantified.data import ValueType
+    return ValueType
+
 
-_absolute_result_class = None
+@lru_cache(maxsize=None)
 def _get_absolute_result_class():
     """
     Private utility function for lazy-loading the AbsoluteResult class.
@@ -48,13 +46,11 @@ def _get_absolute_result_class():
     :return: The AbsoluteResult class
     :rtype: class
     """
-    global _absolute_result_class
-    if not _absolute_result_class:
-        from energyquantified.data import AbsoluteResult
-        _absolute_result_class = AbsoluteResult
-    return _absolute_result_class
+    from energyquantified.data import AbsoluteResult
+    return AbsoluteResult
 
 pd = None
+np = None
 _is_pandas_installed = None
 def is_pandas_installed():
     """
@@ -63,16 +59,25 @@ def is_pandas_installed():
     :return: True when pandas is available on the system, otherwise False
     :rtype: bool
     """
-    global pd, _is_pandas_installed
+    global pd, np, _is_pandas_installed
     if _is_pandas_installed is None:
         try:
             import pandas as pd
+            # numpy is a dependency of pandas
+            import numpy as np
             _is_pandas_installed = True
         except ImportError as e:
             _is_pandas_installed = False
     return _is_pandas_installed
 
 
+_PANDAS_NOT_INSTALLED_MESSAGE = (
+    "You must install the \"pandas\" data analysis library "
+    "to use this functionality. Visit "
+    "https://pandas.pydata.org/docs/ for more information."
+)
+
+
 def assert_pandas_installed():
     """
     Assert that pandas is installed.
@@ -80,15 +85,11 @@ def assert_pandas_installed():
     :raises ImportError: When pandas is not installed on the system
     """
     if not is_pandas_installed():
-        if not is_pandas_installed():
-            raise ImportError(
-                "You must install the \"pandas\" data analysis library "
-                "to use this functionality. Visit "
-                "https://pandas.pydata.org/docs/ for more information."
-            )
+        raise ImportError(_PANDAS_NOT_INSTALLED_MESSAGE)
 
 
-def timeseries_to_dataframe(timeseries, name=None, single_level_header=False):
+def timeseries_to_dataframe(timeseries, name=None, single_level_header=False,
+                            dtype=None):
     """
     Convert a time series to a ``pandas.DataFrame``.
 
@@ -100,6 +101,10 @@ def timeseries_to_dataframe(timeseries, name=None, single_level_header=False):
     :param single_level_header: Set to True to use single-level header \
         in the DataFrame, defaults to False
     :type single_level_header: boolean, optional
+    :param dtype: The floating-point data type of the values, such as \
+        ``numpy.float32`` to halve the memory use, defaults to \
+        ``numpy.float64``
+    :type dtype: numpy.dtype, optional
     :return: A DataFrame
     :rtype: pandas.DataFrame
     :raises ImportError: When pandas is not installed on the system
@@ -118,54 +123,88 @@ def timeseries_to_dataframe(timeseries, name=None, single_level_header=False):
     else:
         include_instance = False
     # Conversion
-    ValueType = _get_value_type_class()
-    if timeseries.value_type() == ValueType.VALUE:
-        # Convert a time series of (date, value)
-        if single_level_header:
-            return _timeseries_to_dataframe_value_single_header(
-                timeseries,
-                name,
-                include_instance=include_instance
-            )
-        else:
-            return _timeseries_to_dataframe_value(
-                timeseries,
-                name
-            )
-    if timeseries.value_type() == ValueType.SCENARIOS:
-        # Convert a time series of (date, scenarios[])
-        if single_level_header:
-            return _timeseries_to_dataframe_scenarios_single_header(
-                timeseries,
-                name,
-                include_instance=include_instance
-            )
-        else:
-            return _timeseries_to_dataframe_scenarios(
-                timeseries,
-                name
-            )
-    if timeseries.value_type() == ValueType.MEAN_AND_SCENARIOS:
-        # Convert a time series of (date, value, scenarios[])
-        if single_level_header:
-            return _timeseries_to_dataframe_mean_and_scenarios_single_header(
-                timeseries,
-                name,
-                include_instance=include_instance
-            )
-        else:
-            return _timeseries_to_dataframe_mean_and_scenarios(
-                timeseries,
-                name
-            )
-    # Unknown value type for time series
-    raise ValueError(
-        "Unknown ValueType: timeseries.value_type = "
-        f"{timeseries.value_type()}"
+    return _timeseries_to_dataframe(
+        timeseries,
+        name,
+        _dates_to_index([v.date for v in timeseries.data]),
+        include_instance=include_instance,
+        single_level_header=single_level_header,
+        dtype=np.float64 if dtype is None else dtype
     )
 
 
-def _timeseries_to_dataframe_value(timeseries, name):
+def _timeseries_to_dataframe(timeseries, name, index, include_instance=True,
+                             single_level_header=False, dtype=None):
+    """
+    Private utility function for converting a time series to a pandas
+    dataframe with a given index, picking the conversion for its value type.
+
+    :param timeseries: A time series object
+    :type timeseries: Timeseries
+    :param name: The time series name
+    :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param include_instance: Include the instance in the header?
+    :type include_instance: bool
+    :param single_level_header: Use a single-level header?
+    :type single_level_header: bool
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
+    :return: A pandas DataFrame
+    :rtype: pandas.DataFrame
+    """
+    value_type = timeseries.value_type()
+    converters = _get_dataframe_converters()
+    try:
+        convert, convert_single_header = converters[value_type]
+    except KeyError:
+        # Unknown value type for time series
+        raise ValueError(
+            f"Unknown ValueType: timeseries.value_type = {value_type}"
+        )
+    if single_level_header:
+        return convert_single_header(
+            timeseries,
+            name,
+            index,
+            dtype,
+            include_instance=include_instance
+        )
+    return convert(timeseries, name, index, dtype)
+
+
+@lru_cache(maxsize=None)
+def _get_dataframe_converters():
+    """
+    Private utility function for lazy-loading a lookup of the conversion
+    functions for each value type, as a tuple of (three-level header
+    conversion, single-level header conversion).
+
+    :return: A dict of ValueType to conversion functions
+    :rtype: dict
+    """
+    ValueType = _get_value_type_class()
+    return {
+        # A time series of (date, value)
+        ValueType.VALUE: (
+            _timeseries_to_dataframe_value,
+            _timeseries_to_dataframe_value_single_header,
+        ),
+        # A time series of (date, scenarios[])
+        ValueType.SCENARIOS: (
+            _timeseries_to_dataframe_scenarios,
+            _timeseries_to_dataframe_scenarios_single_header,
+        ),
+        # A time series of (date, value, scenarios[])
+        ValueType.MEAN_AND_SCENARIOS: (
+            _timeseries_to_dataframe_mean_and_scenarios,
+            _timeseries_to_dataframe_mean_and_scenarios_single_header,
+        ),
+    }
+
+
+def _timeseries_to_dataframe_value(timeseries, name, index, dtype):
     """
     Private utility function for converting a time series of single values
     to a pandas dataframe.
@@ -176,27 +215,31 @@ def _timeseries_to_dataframe_value(timeseries, name):
     :type timeseries: Timeseries
     :param name: The time series name
     :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
     :return: A pandas DataFrame
     :rtype: pandas.DataFrame
     """
     # Column headers
-    columns = [
-        [name],
-        [timeseries.instance_or_contract_dataframe_column_header()],
+    columns = _three_level_columns(
+        name,
+        timeseries.instance_or_contract_dataframe_column_header(),
         ['']
-    ]
+    )
     # Convert a time series of (date, value)
-    df = pd.DataFrame.from_records(
-        ((v.value,) for v in timeseries),
+    df = pd.DataFrame(
+        _values_to_array(timeseries.data, dtype),
         columns=columns,
-        index=[v.date for v in timeseries],
+        index=index,
     )
     df.index.name = 'date'
     return df
 
 
-def _timeseries_to_dataframe_value_single_header(timeseries, name,
-        include_instance=True):
+def _timeseries_to_dataframe_value_single_header(timeseries, name, index,
+        dtype, include_instance=True):
     """
     Private utility function for converting a time series of single values
     to a pandas dataframe.
@@ -207,6 +250,10 @@ def _timeseries_to_dataframe_value_single_header(timeseries, name,
     :type timeseries: Timeseries
     :param name: The time series name
     :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
     :param include_instance: Include the instance in the header?
     :type include_instance: bool
     :return: A pandas DataFrame
@@ -219,16 +266,16 @@ def _timeseries_to_dataframe_value_single_header(timeseries, name,
     else:
         columns = [name]
     # Convert a time series of (date, value)
-    df = pd.DataFrame.from_records(
-        ((v.value,) for v in timeseries),
+    df = pd.DataFrame(
+        _values_to_array(timeseries.data, dtype),
         columns=columns,
-        index=[v.date for v in timeseries],
+        index=index,
     )
     df.index.name = 'date'
     return df
 
 
-def _timeseries_to_dataframe_scenarios(timeseries, name):
+def _timeseries_to_dataframe_scenarios(timeseries, name, index, dtype):
     """
     Private utility function for converting a time series of scenario values
     to a pandas dataframe.
@@ -239,28 +286,32 @@ def _timeseries_to_dataframe_scenarios(timeseries, name):
     :type timeseries: Timeseries
     :param name: The time series name
     :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
     :return: A pandas DataFrame
     :rtype: pandas.DataFrame
     """
     width = timeseries.total_values_per_item()
     # Column headers
-    columns = [
-        [name] * width,
-        [timeseries.instance_or_contract_dataframe_column_header()] * width,
+    columns = _three_level_columns(
+        name,
+        timeseries.instance_or_contract_dataframe_column_header(),
         timeseries.scenario_names
-    ]
+    )
     # Convert a time series of (date, scenarios[])
-    df = pd.DataFrame.from_records(
-        (v.scenarios for v in timeseries.data),
+    df = pd.DataFrame(
+        _scenarios_to_array(timeseries.data, width, dtype),
         columns=columns,
-        index=[v.date for v in timeseries],
+        index=index,
     )
     df.index.name = 'date'
     return df
 
 
-def _timeseries_to_dataframe_scenarios_single_header(timeseries, name,
-        include_instance=True):
+def _timeseries_to_dataframe_scenarios_single_header(timeseries, name, index,
+        dtype, include_instance=True):
     """
     Private utility function for converting a time series of scenario values
     to a pandas dataframe.
@@ -271,6 +322,10 @@ def _timeseries_to_dataframe_scenarios_single_header(timeseries, name,
     :type timeseries: Timeseries
     :param name: The time series name
     :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
     :param include_instance: Include the instance in the header?
     :type include_instance: bool
     :return: A pandas DataFrame
@@ -280,8 +335,9 @@ def _timeseries_to_dataframe_scenarios_single_header(timeseries, name,
     # Column header
     if include_instance:
         instance = timeseries.instance_or_contract_dataframe_column_header()
+        prefix = f"{name} {instance}"
         columns = [
-            f"{name} {instance} {scenario}".strip()
+            f"{prefix} {scenario}".strip()
             for scenario in timeseries.scenario_names
         ]
     else:
@@ -290,16 +346,16 @@ def _timeseries_to_dataframe_scenarios_single_header(timeseries, name,
             for scenario in timeseries.scenario_names
         ]
     # Convert a time series of (date, scenarios[])
-    df = pd.DataFrame.from_records(
-        (v.scenarios for v in timeseries.data),
+    df = pd.DataFrame(
+        _scenarios_to_array(timeseries.data, width, dtype),
         columns=columns,
-        index=[v.date for v in timeseries],
+        index=index,
     )
     df.index.name = 'date'
     return df
 
 
-def _timeseries_to_dataframe_mean_and_scenarios(timeseries, name):
+def _timeseries_to_dataframe_mean_and_scenarios(timeseries, name, index, dtype):
     """
     Private utility function for converting a time series of a mean value
     and scenarios to a pandas dataframe.
@@ -310,28 +366,32 @@ def _timeseries_to_dataframe_mean_and_scenarios(timeseries, name):
     :type timeseries: Timeseries
     :param name: The time series name
     :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
     :return: A pandas DataFrame
     :rtype: pandas.DataFrame
     """
     width = timeseries.total_values_per_item()
     # Column headers
-    columns = [
-        [name] * width,
-        [timeseries.instance_or_contract_dataframe_column_header()] * width,
+    columns = _three_level_columns(
+        name,
+        timeseries.instance_or_contract_dataframe_column_header(),
         [''] + timeseries.scenario_names
-    ]
+    )
     # Convert a time series of (date, scenarios[])
-    df = pd.DataFrame.from_records(
-        ((v.value, *v.scenarios) for v in timeseries.data),
+    df = pd.DataFrame(
+        _mean_and_scenarios_to_array(timeseries.data, width, dtype),
         columns=columns,
-        index=[v.date for v in timeseries],
+        index=index,
     )
     df.index.name = 'date'
     return df
 
 
-def _timeseries_to_dataframe_mean_and_scenarios_single_header(timeseries, name,
-        include_instance=True):
+def _timeseries_to_dataframe_mean_and_scenarios_single_header(timeseries, name, index,
+        dtype, include_instance=True):
     """
     Private utility function for converting a time series of a mean value
     and scenarios to a pandas dataframe.
@@ -342,6 +402,10 @@ def _timeseries_to_dataframe_mean_and_scenarios_single_header(timeseries, name,
     :type timeseries: Timeseries
     :param name: The time series name
     :type name: str
+    :param index: The index (the dates of the time series)
+    :type index: pandas.Index
+    :param dtype: The data type of the values
+    :type dtype: numpy.dtype
     :param include_instance: Include the instance in the header?
     :type include_instance: bool
     :return: A pandas DataFrame
@@ -352,25 +416,173 @@ def _timeseries_to_dataframe_mean_and_scenarios_single_header(timeseries, name,
     scenario_names = [''] + timeseries.scenario_names
     if include_instance:
         instance = timeseries.instance_or_contract_dataframe_column_header()
+        prefix = f"{name} {instance}"
         columns = [
-            f"{name} {instance} {scenario}".strip()
-            for scenario in scenario_names
+            f"{prefix} {scenario}".strip() for scenario in scenario_names
         ]
     else:
         columns = [
             f"{name} {scenario}".strip() for scenario in scenario_names
         ]
     # Convert a time series of (date, scenarios[])
-    df = pd.DataFrame.from_records(
-        ((v.value, *v.scenarios) for v in timeseries.data),
+    df = pd.DataFrame(
+        _mean_and_scenarios_to_array(timeseries.data, width, dtype),
         columns=columns,
-        index=[v.date for v in timeseries],
+        index=index,
     )
     df.index.name = 'date'
     return df
 
 
-def timeseries_list_to_dataframe(timeseries_list, single_level_header=False):
+def _three_level_columns(name, instance, scenario_names):
+    """
+    Private utility function for creating a three-level column header
+    (name, instance and scenario) for a single time series.
+
+    Builds the ``MultiIndex`` from its levels and codes directly, as the name
+    and instance are the same for all columns. This avoids factorizing each
+    level, which is what ``pd.MultiIndex.from_arrays()`` does.
+
+    :param name: The time series name
+    :type name: str
+    :param instance: The instance (or contract) column header
+    :type instance: str
+    :param scenario_names: The scenario names (one per column)
+    :type scenario_names: list[str]
+    :return: A column header
+    :rtype: pandas.MultiIndex
+    """
+    width = len(scenario_names)
+    if name is None or len(set(scenario_names)) < width:
+        # Levels must be unique and without missing values, so let pandas
+        # factorize the arrays instead
+        return pd.MultiIndex.from_arrays([
+            [name] * width,
+            [instance] * width,
+            scenario_names
+        ])
+    zeros = np.zeros(width, dtype=np.int8)
+    return pd.MultiIndex(
+        levels=[[name], [instance], scenario_names],
+        codes=[zeros, zeros, np.arange(width)],
+        verify_integrity=False
+    )
+
+
+def _dates_to_index(dates):
+    """
+    Private utility function for converting a list of date-times to an
+    index for a pandas DataFrame.
+
+    Timezone-aware date-times are parsed as UTC instants and converted to
+    their timezone afterwards, which is about twice as fast as letting
+    pandas resolve the UTC offset of each date-time.
+
+    :param dates: A list of date-times
+    :type dates: list[datetime]
+    :return: An index
+    :rtype: pandas.DatetimeIndex
+    """
+    if not dates or dates[0].tzinfo is None:
+        return dates
+    return pd.to_datetime(dates, utc=True).tz_convert(dates[0].tzinfo)
+
+
+def _zone_of(dates):
+    """
+    Private utility function for getting the timezone of a list of
+    date-times, in a form that can be compared between lists (pytz gives
+    each UTC offset of a timezone its own tzinfo instance).
+
+    :param dates: A list of date-times
+    :type dates: list[datetime]
+    :return: The timezone name (or the tzinfo when it has no name), or None \
+        for an empty list or naive date-times
+    :rtype: str, tzinfo, NoneType
+    """
+    if not dates:
+        return None
+    tzinfo = dates[0].tzinfo
+    return getattr(tzinfo, "zone", tzinfo)
+
+
+def _values_to_array(data, dtype):
+    """
+    Private utility function for converting a list of Value to a float
+    array with a single column. Missing values (None) become NaN.
+
+    :param data: A list of Value
+    :type data: list[Value]
+    :param dtype: The floating-point data type of the array
+    :type dtype: numpy.dtype
+    :return: An array with shape (len(data), 1)
+    :rtype: numpy.ndarray
+    """
+    count = len(data)
+    return np.fromiter(
+        (v.value for v in data),
+        dtype=dtype,
+        count=count
+    ).reshape(count, 1)
+
+
+def _scenarios_to_array(data, width, dtype):
+    """
+    Private utility function for converting a list of ScenariosValue (or
+    MeanScenariosValue) to a two-dimensional float array of the scenarios.
+    Streams the scenarios straight into the array instead of building an
+    intermediate list of rows. Missing values (None) become NaN.
+
+    :param data: A list of ScenariosValue or MeanScenariosValue
+    :type data: list[ScenariosValue]
+    :param width: The number of scenarios
+    :type width: int
+    :param dtype: The floating-point data type of the array
+    :type dtype: numpy.dtype
+    :return: An array with shape (len(data), width)
+    :rtype: numpy.ndarray
+    :raises ValueError: When a value doesn't have exactly width scenarios
+    """
+    # The array is filled as one flat stream, so a value with too few or too
+    # many scenarios would shift the remaining values into the wrong columns
+    for value in data:
+        if len(value.scenarios) != width:
+            raise ValueError(
+                f"Expected {width} scenarios but got "
+                f"{len(value.scenarios)} at {value.date}"
+            )
+    count = len(data)
+    return np.fromiter(
+        chain.from_iterable(v.scenarios for v in data),
+        dtype=dtype,
+        count=count * width
+    ).reshape(count, width)
+
+
+def _mean_and_scenarios_to_array(data, width, dtype):
+    """
+    Private utility function for converting a list of MeanScenariosValue
+    to a two-dimensional float array, with the mean value in the first
+    column and the scenarios in the remaining columns. Missing values (None)
+    become NaN.
+
+    :param data: A list of MeanScenariosValue
+    :type data: list[MeanScenariosValue]
+    :param width: The number of columns (the mean plus all scenarios)
+    :type width: int
+    :param dtype: The floating-point data type of the array
+    :type dtype: numpy.dtype
+    :return: An array with shape (len(data), width)
+    :rtype: numpy.ndarray
+    """
+    array = np.empty((len(data), width), dtype=dtype)
+    array[:, :1] = _values_to_array(data, dtype)
+    array[:, 1:] = _scenarios_to_array(data, width - 1, dtype)
+    return array
+
+
+def timeseries_list_to_dataframe(timeseries_list, single_level_header=False,
+                                 dtype=None):
     """
     Convert a list of time series to a ``pandas.DataFrame``.
 
@@ -379,26 +591,47 @@ def timeseries_list_to_dataframe(timeseries_list, single_level_header=False):
     :param single_level_header: Set to True to use single-level header \
         in the DataFrame, defaults to False
     :type single_level_header: boolean, optional
+    :param dtype: The floating-point data type of the values, such as \
+        ``numpy.float32`` to halve the memory use, defaults to \
+        ``numpy.float64``
+    :type dtype: numpy.dtype, optional
     :return: A pandas DataFrame
     :rtype: pandas.DataFrame
     """
     # Checks
     assert_pandas_installed()
     assert timeseries_list, "timeseries list is empty"
+    Timeseries = _get_timeseries_class()
     for index, timeseries in enumerate(timeseries_list):
-        assert isinstance(timeseries, _get_timeseries_class()), (
+        assert isinstance(timeseries, Timeseries), (
             f"timeseries_list[{index}] must be an instance of "
             f"energyquantified.data.Timeseries, but was: {type(timeseries)}"
         )
+    # Convert each time series. Time series with the same dates (in the same
+    # timezone) as the previous one share its index, so that it is built
+    # only once, and so that concat doesn't have to align them.
+    if dtype is None:
+        dtype = np.float64
+    frames = []
+    dates = zone = index = None
+    for timeseries in timeseries_list:
+        ts_dates = [v.date for v in timeseries.data]
+        # Aware date-times are equal when they are the same instant, even
+        # if they are in different timezones, so compare the zones as well
+        ts_zone = _zone_of(ts_dates)
+        if ts_dates != dates or ts_zone != zone:
+            dates = ts_dates
+            zone = ts_zone
+            index = _dates_to_index(dates)
+        frames.append(_timeseries_to_dataframe(
+            timeseries,
+            timeseries.name,
+            index,
+            single_level_header=single_level_header,
+            dtype=dtype
+        ))
     # Merge into one data frame
-    return pd.concat(
-        [
-            ts.to_dataframe(single_level_header=single_level_header)
-            for ts in timeseries_list
-        ],
-        axis=1,
-        sort=True,
-    )
+    return pd.concat(frames, axis=1, sort=True)
 
 
 def ohlc_list_to_dataframe(ohlc_list):
@@ -406,6 +639,10 @@ def ohlc_list_to_dataframe(ohlc_list):
     Convert an :py:class:`energyquantified.data.OHLCList` to a
     ``pandas.DataFrame``.
 
+    The price columns (open, high, low, close and settlement) are always
+    ``float64``, with NaN for missing prices. This holds even when all
+    prices are whole numbers or missing, or when the list is empty.
+
     :param ohlc_list: A list of OHLC objects
     :type ohlc_list: OHLCList
     :return: A DataFrame
@@ -417,22 +654,82 @@ def ohlc_list_to_dataframe(ohlc_list):
     assert isinstance(ohlc_list, _get_ohlc_list_class()), (
         "ohlc_list must be an instance of energyquantified.data.OHLCList"
     )
-    # Conversion
-    return pd.DataFrame.from_records((
-        {
-            "traded": ohlc.product.traded,
-            "period": ohlc.product.period.tag,
-            "front": ohlc.product.front,
-            "delivery": ohlc.product.delivery,
-            "open": ohlc.open,
-            "high": ohlc.high,
-            "low": ohlc.low,
-            "close": ohlc.close,
-            "settlement": ohlc.settlement,
-            "volume": ohlc.volume,
-            "open_interest": ohlc.open_interest,
-        } for ohlc in ohlc_list
-    ))
+    # Conversion (column by column). The prices are always floats, so they
+    # are converted to float arrays up front instead of letting pandas infer
+    # the type of each column (volume and open interest are integers).
+    products = [ohlc.product for ohlc in ohlc_list]
+    return pd.DataFrame({
+        "traded": [product.traded for product in products],
+        "period": [product.period.tag for product in products],
+        "front": [product.front for product in products],
+        "delivery": [product.delivery for product in products],
+        "open": _float_array([ohlc.open for ohlc in ohlc_list]),
+        "high": _float_array([ohlc.high for ohlc in ohlc_list]),
+        "low": _float_array([ohlc.low for ohlc in ohlc_list]),
+        "close": _float_array([ohlc.close for ohlc in ohlc_list]),
+        "settlement": _float_array([ohlc.settlement for ohlc in ohlc_list]),
+        "volume": [ohlc.volume for ohlc in ohlc_list],
+        "open_interest": [ohlc.open_interest for ohlc in ohlc_list],
+    })
+
+
+def _float_array(values):
+    """
+    Private utility function for converting a list of numbers to a float
+    array. Missing values (None) become NaN.
+
+    :param values: A list of numbers or None
+    :type values: list
+    :return: A float array
+    :rtype: numpy.ndarray
+    """
+    return np.array(values, dtype=np.float64)
+
+
+def resolution_to_datetime_index(resolution, begin, end):
+    """
+    Create a ``pandas.DatetimeIndex`` of all date-times between `begin`
+    (inclusive) and `end` (exclusive) in a resolution.
+
+    :param resolution: The resolution
+    :type resolution: Resolution
+    :param begin: The begin date-time (inclusive)
+    :type begin: datetime
+    :param end: The end date-time (exclusive)
+    :type end: datetime
+    :return: A DatetimeIndex with the same date-times as\
+        ``resolution.enumerate(begin, end)``
+    :rtype: pandas.DatetimeIndex
+    :raises ImportError: When pandas is not installed on the system
+    """
+    assert_pandas_installed()
+    frequency = resolution.frequency
+    tz = begin.tzinfo
+    if frequency.field in ("years", "months", "weeks", "days"):
+        # Step in local wall-clock time and localize afterwards, the same
+        # way as Resolution.enumerate() does for calendar frequencies
+        if frequency.field == "years":
+            freq = f"{frequency.steps * 12}MS"
+        elif frequency.field == "months":
+            freq = f"{frequency.steps}MS"
+        else:
+            freq = pd.Timedelta(frequency.delta)
+        if tz is None:
+            index = pd.date_range(begin, end, freq=freq)
+        else:
+            local_end = pd.Timestamp(end).tz_convert(tz).tz_localize(None)
+            index = pd.date_range(
+                begin.replace(tzinfo=None),
+                local_end,
+                freq=freq
+            ).tz_localize(tz)
+    else:
+        # Fixed-length steps. pandas requires begin and end to be in the
+        # same timezone, so convert end to the timezone of begin.
+        if tz is not None:
+            end = pd.Timestamp(end).tz_convert(tz)
+        index = pd.date_range(begin, end, freq=pd.Timedelta(frequency.delta))
+    return index[index < end]
 
 
 def absolute_result_to_dataframe(absolute_result, name=None, single_level_index=False):
@@ -474,18 +771,17 @@ def absolute_result_to_dataframe(absolute_result, name=None, single_level_index=
 
 
 def _absolute_result_to_dataframe(absolute_result, name):
-    # Column headers
-    columns = [
-        f"{name} {absolute_result.delivery:%Y-%m-%d %H:%M}".strip()
-    ]
-    # Create dataframe
-    df = pd.DataFrame.from_records(
-        ((item.value,) for item in absolute_result.items),
-        columns=columns,
+    items = absolute_result.items
+    instances = [item.instance for item in items]
+    # Column header
+    column = f"{name} {absolute_result.delivery:%Y-%m-%d %H:%M}".strip()
+    # Create dataframe from the value column
+    df = pd.DataFrame(
+        {column: [item.value for item in items]},
         index=pd.MultiIndex.from_arrays(
             [
-                [f"{item.instance.issued:%Y-%m-%d %H:%M}" for item in absolute_result.items],
-                [item.instance.tag for item in absolute_result.items]
+                [f"{instance.issued:%Y-%m-%d %H:%M}" for instance in instances],
+                [instance.tag for instance in instances]
             ],
             names=['issued', 'tag']
         )
@@ -494,17 +790,15 @@ def _absolute_result_to_dataframe(absolute_result, name):
 
 
 def _absolute_result_to_dataframe_single_index(absolute_result, name):
-    # Column headers
-    columns = [
-        f"{name} {absolute_result.delivery:%Y-%m-%d %H:%M}".strip()
-    ]
-    # Create dataframe
-    df = pd.DataFrame.from_records(
-        ((item.value,) for item in absolute_result.items),
-        columns=columns,
+    items = absolute_result.items
+    # Column header
+    column = f"{name} {absolute_result.delivery:%Y-%m-%d %H:%M}".strip()
+    # Create dataframe from the value column
+    df = pd.DataFrame(
+        {column: [item.value for item in items]},
         index=[
             item.instance.as_dataframe_column_header()
-            for item in absolute_result.items
+            for item in items
         ],
     )
     df.index.name = 'instance'
@@ -11,16 +11,10 @@ eq = EnergyQuantified(api_key="aaaaaa-bbbbbb-cccccc-ddddddd")
 # production actuals
 curve_name = "DE Wind Power Production MWh/h 15min Forecast"
 
-# Curve alternative #2: Find the Curve for German wind
-# production actuals
-curves = eq.metadata.curves(
-    area='DE',
-    exact_category='wind power production',
-    curve_type='instance',
-    data_type='forecast'
-)
-# Get the first curve (there should only be one result)
-curve = curves[0]
+# Curve alternative #2: Look up the Curve object by its name (see
+# search.py for how to search for curves). The client caches the result,
+# so looking up the same name again does not hit the server.
+curve = eq.metadata.curve(curve_name)
 
 # --- Load forecast #1 ---
 
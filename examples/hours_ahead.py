@@ -14,7 +14,7 @@ Usage:
 
  2. Add API key below: eq = EnergyQuantified(api_key='...')
 
- 3. Change options (line 41-47). You should update the begin and the end
+ 3. Change options (line 49-55). You should update the begin and the end
     datetime in particular.
 
  4. Run script
@@ -23,8 +23,9 @@ Usage:
 ---
 
 Note: This script may take some time to run, as it loads the forecasts
-from one day at a time in a loop. If you need to check day-ahead forecasts,
-you would be better off using relative(). See the documentation for more info:
+from one day at a time (a few days concurrently). If you need to check
+day-ahead forecasts, you would be better off using relative(). See the
+documentation for more info:
 
 https://energyquantified-python.readthedocs.io/en/latest/userguide/instances.html#relative-queries-day-ahead-forecasts
 """
@@ -33,9 +34,12 @@ from energyquantified import EnergyQuantified
 from energyquantified.time import Frequency, UTC
 from energyquantified.data import TimeseriesList
 
+import numpy as np
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain
 
 
 # Initialize the client
@@ -52,47 +56,63 @@ time_ahead = timedelta(hours=1)  # How far ahead you want at minimum (default: a
 name = "wind"  # Shorter name for columns
 
 
-# Load data in loop – one load per day
-forecasts = []
+# One load per day
 load_step = timedelta(days=1)
+windows = []
 d = begin
 while d < end:
-    earliest = d
-    latest = d + load_step - timedelta(seconds=1)  # 23:59:59
-    instances = eq.instances.load(
+    windows.append((d, d + load_step - timedelta(seconds=1)))  # 23:59:59
+    d += load_step
+
+
+def load_forecasts(window):
+    earliest, latest = window
+    return eq.instances.load(
         curve_name,
         tags=tags,
         issued_at_earliest=earliest,
         issued_at_latest=latest,
         frequency=frequency
     )
-    forecasts += instances
-    d += load_step
+
+
+# Load the days concurrently (the client still rate-limits the requests)
+with ThreadPoolExecutor(max_workers=4) as executor:
+    forecasts = list(chain.from_iterable(
+        executor.map(load_forecasts, windows)
+    ))
 
 # Prepare data
 forecasts = sorted(forecasts, key=lambda f: (f.instance.issued, f.instance.tag))
 for f in forecasts:
     created = f.instance.created + time_ahead
     cutoff = created + timedelta(hours=24)
-    f.data = list(filter(lambda d: d.date >= created and d.date < cutoff, f.data))
+    f.data = [v for v in f.data if created <= v.date < cutoff]
     f.set_name(name)
 
 # To dataframe using EQ's util
 # Data is sorted from oldest (in the first column) to most recent (in the last
-# column). Therefore, we can use pandas' fillna with backfill (see below).
+# column). Therefore, we can pick the first non-NaN value per row (see below).
 timeseries_list = TimeseriesList(forecasts)
 df = timeseries_list.to_df(single_level_header=True)
 
-# Get first avail non-NaN value per row
-# https://datascientyst.com/get-first-non-null-value-per-row-pandas/
+# Find the column of the first non-NaN value per row (in one pass over the
+# values instead of a Python function call per row)
+has_value = df.notna().to_numpy()
+first_column = has_value.argmax(axis=1)
+has_any_value = has_value.any(axis=1)
 
-# Get the data
-df_data = df.fillna(method='bfill', axis=1).iloc[:, 0].to_frame()
-df_data.columns = ['data']
+# Get the data (rows without any value are NaN)
+df_data = pd.DataFrame(
+    {'data': df.to_numpy()[np.arange(len(df)), first_column]},
+    index=df.index
+)
 
 # Get the forecast used for each value
-df_instances = df.apply(lambda s: pd.Series.first_valid_index(s)[0], axis=1).to_frame()
-df_instances.columns = ['instance']
+df_instances = pd.DataFrame(
+    {'instance': np.where(has_any_value, df.columns[first_column], None)},
+    index=df.index
+)
 
 print("Most recent data, up to one hour before delivery:")
 print(df_data)
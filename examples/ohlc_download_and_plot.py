@@ -34,8 +34,9 @@ eq = EnergyQuantified(api_key='INSERT API KEY HERE')  # <- API key goes here
 
 # Set options
 curve = 'NP Futures Power Base EUR/MWh Nasdaq OHLC'
-begin = date.today() - timedelta(days=29)  # Trial users get 30 days
-end = date.today()
+today = date.today()
+begin = today - timedelta(days=29)  # Trial users get 30 days
+end = today
 
 # Get the front quarter date for 'today' (i.e. 2020-07-01 = Q3-2020)
 quarter_delivery = (
@@ -50,7 +51,7 @@ assert eq.is_api_key_valid(), "API key is not valid"
 
 # Download data
 ohlc_list = eq.ohlc.load(
-    'NP Futures Power Base EUR/MWh Nasdaq OHLC',
+    curve,
     begin=begin,
     end=end,
     period='quarter',
@@ -65,8 +66,8 @@ df = ohlc_list.to_dataframe()
 # df = df[df['period'] == 'quarter']
 # df = df[df['delivery'] == quarter_delivery]
 
-# Map traded to matplotlib date
-df['traded'] = df['traded'].map(mdates.date2num)
+# Map traded to matplotlib date (converts the whole column in one call)
+df['traded'] = mdates.date2num(df['traded'].to_numpy())
 
 # Create 10-day and 3-day moving averages over settlement price
 # (for demonstration purposes, not for analysis)
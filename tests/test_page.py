@@ -0,0 +1,63 @@
+import pytest
+
+from energyquantified.utils import Page
+
+
+def _load_page(page=1):
+    # Three pages with two items each
+    return Page(
+        [f"item-{page}-1", f"item-{page}-2"],
+        page=page,
+        page_size=2,
+        total_items=6,
+        first_page=1,
+        last_page=3,
+        page_load_func=_load_page,
+    )
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_all(prefetch):
+    items = list(_load_page().iter_all(prefetch=prefetch))
+    assert items == [
+        f"item-{page}-{i}" for page in range(1, 4) for i in range(1, 3)
+    ]
+
+
+def test_iter_all_single_page():
+    page = Page(["a", "b"], page=1, first_page=1, last_page=1)
+    assert list(page.iter_all()) == ["a", "b"]
+
+
+class _Response:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+_HEADERS = {
+    "X-Current-Page": "2",
+    "X-Page-Size": "10",
+    "X-First-Page": "1",
+    "X-Last-Page": "3",
+    "X-Total-Items": "25",
+}
+
+
+def test_response_to_page():
+    page = Page._response_to_page(["a"], _Response(_HEADERS))
+    assert page == ["a"]
+    assert page.page == 2
+    assert page.page_size == 10
+    assert page.first_page == 1
+    assert page.last_page == 3
+    assert page.total_pages == 3
+    assert page.total_items == 25
+    assert page.has_next_page()
+    assert page.has_previous_page()
+
+
+def test_response_to_page_with_missing_header():
+    headers = dict(_HEADERS)
+    del headers["X-Last-Page"]
+    with pytest.raises(TypeError):
+        Page._response_to_page(["a"], _Response(headers))
@@ -0,0 +1,55 @@
+import pytest
+
+from energyquantified.data import (
+    MeanScenariosValue, ScenariosValue, Timeseries, TimeseriesList, Value
+)
+from energyquantified.time import (
+    CET, UTC, Frequency, Resolution, get_datetime, to_timezone
+)
+
+
+def _timeseries(tz):
+    resolution = Resolution(Frequency.PT1H, tz)
+    # The same instants for all timezones
+    begin = to_timezone(get_datetime(2021, 1, 1, tz=CET), tz)
+    dates = resolution.enumerate(begin, resolution.shift(begin, 24))
+    return Timeseries(
+        resolution=resolution,
+        data=[Value(d, float(i)) for i, d in enumerate(dates)],
+    )
+
+
+@pytest.mark.parametrize("timezones", [(CET, UTC), (UTC, CET)])
+def test_timeseries_list_to_dataframe_with_mixed_timezones(timezones):
+    pytest.importorskip("pandas")
+    timeseries_list = TimeseriesList([_timeseries(tz) for tz in timezones])
+    df = timeseries_list.to_dataframe()
+    # The same instants in different timezones are aligned in UTC, the way
+    # pandas aligns them when the series have separate indexes
+    assert str(df.index.tz) == "UTC"
+    assert len(df) == 24
+
+
+def _ragged_data(value_class, *values):
+    resolution = Resolution(Frequency.PT1H, CET)
+    begin = get_datetime(2021, 1, 1, tz=CET)
+    dates = resolution.enumerate(begin, resolution.shift(begin, 3))
+    return [
+        value_class(d, *values, scenarios)
+        for d, scenarios in zip(dates, [(1.0, 2.0), (3.0,), (4.0, 5.0, 6.0)])
+    ]
+
+
+@pytest.mark.parametrize("value_class, values", [
+    (ScenariosValue, ()),
+    (MeanScenariosValue, (0.0,)),
+])
+def test_timeseries_to_dataframe_with_ragged_scenarios(value_class, values):
+    pytest.importorskip("pandas")
+    timeseries = Timeseries(
+        resolution=Resolution(Frequency.PT1H, CET),
+        data=_ragged_data(value_class, *values),
+        scenario_names=["a", "b"],
+    )
+    with pytest.raises(ValueError):
+        timeseries.to_dataframe()
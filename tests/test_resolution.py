@@ -0,0 +1,21 @@
+import pytest
+
+from energyquantified.time import CET, UTC, Frequency, Resolution, get_datetime
+
+
+@pytest.mark.parametrize("frequency", [
+    Frequency.PT15M,
+    Frequency.PT1H,
+    Frequency.P1D,
+])
+def test_enumerate_array_with_mixed_timezones(frequency):
+    pd = pytest.importorskip("pandas")
+    resolution = Resolution(frequency, CET)
+    # Begin in CET and end in UTC, across the switch to summer time
+    begin = get_datetime(2021, 3, 27, tz=CET)
+    end = get_datetime(2021, 4, 2, tz=UTC)
+    expected = list(resolution.enumerate(begin, end))
+    index = resolution.enumerate_array(begin, end)
+    assert len(index) == len(expected)
+    assert list(index) == [pd.Timestamp(d) for d in expected]
+    assert index[0].tzinfo.zone == begin.tzinfo.zone